@@ -0,0 +1,124 @@
+"""
+Tests for wifebot.loader.
+"""
+
+import pytest
+from jinja2 import Template
+
+from wifebot.loader import _render_simple_template, render_prompt_string, render_prompt_template
+
+
+CONFIG = {
+    'name': 'Ada',
+    'flag': True,
+    'nothing': None,
+    'user_profile': {'gender': 'man', 'traits': ['Funny', 'Direct']},
+    'd': {'keys': 'item', 'plain': 'value'},
+}
+
+
+@pytest.mark.parametrize('template_src', [
+    'Hello {{ name }}',
+    'I am a {{user_profile.gender}}!',
+    '{{ flag }} {{ nothing }} {{ user_profile.traits }}',
+    'Missing: [{{ missing }}] [{{ user_profile.missing }}]',
+    'Literal {braces} stay {{ d.plain }}',
+])
+def test_simple_template_matches_jinja(template_src):
+    rendered = _render_simple_template(template_src, CONFIG)
+    
+    assert rendered is not None
+    assert rendered == Template(template_src).render(CONFIG).strip()
+
+
+@pytest.mark.parametrize('template_src', [
+    'x {{ user_profile.traits.0 }} y',
+    '{{ d.keys }}',
+    '{{ name.upper }}',
+    '{{ missing.attr }}',
+    '{{ range }}',
+    '{{ true }}',
+    '{{ self }}',
+    '{{ name | upper }}',
+    '{% if flag %}yes{% endif %}',
+    '{# comment #}',
+])
+def test_simple_template_defers_to_jinja(template_src):
+    assert _render_simple_template(template_src, CONFIG) is None
+
+
+TEMPLATE = 'Hi {% if name %}{{ name }}{% endif %}'
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    return tmp_path / 'cache' / 'wifebot' / 'prompts'
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    prompts = tmp_path / 'prompts'
+    prompts.mkdir()
+    (prompts / 'task.jinja').write_text(TEMPLATE, encoding='utf-8')
+    return prompts
+
+
+def test_sidecar_hit_matches_fresh_render(cache_dir, prompts_dir):
+    first = render_prompt_template('task.jinja', {'name': 'Ada'}, prompts_dir)
+    second = render_prompt_template('task.jinja', {'name': 'Ada'}, prompts_dir)
+    
+    assert first == second == Template(TEMPLATE).render(name='Ada').strip()
+    assert len(list(cache_dir.glob('task.jinja.*.txt'))) == 1
+
+
+def test_sidecar_new_config_prunes_old_file(cache_dir, prompts_dir):
+    render_prompt_template('task.jinja', {'name': 'Ada'}, prompts_dir)
+    old_files = set(cache_dir.glob('task.jinja.*.txt'))
+    
+    assert render_prompt_template('task.jinja', {'name': 'Bob'}, prompts_dir) == 'Hi Bob'
+    new_files = set(cache_dir.glob('task.jinja.*.txt'))
+    assert len(new_files) == 1
+    assert new_files.isdisjoint(old_files)
+
+
+@pytest.mark.parametrize('tag', [
+    '{% include "part.jinja" %}',
+    '{%- include "part.jinja" %}',
+    '{%+ include "part.jinja" %}',
+    '{% extends "part.jinja" %}',
+])
+def test_sidecar_skips_templates_referencing_others(cache_dir, prompts_dir, tag):
+    (prompts_dir / 'part.jinja').write_text('part', encoding='utf-8')
+    (prompts_dir / 'outer.jinja').write_text(tag, encoding='utf-8')
+    
+    assert render_prompt_template('outer.jinja', {}, prompts_dir) == 'part'
+    assert not cache_dir.exists() or not list(cache_dir.iterdir())
+
+
+def test_sidecar_corrupt_file_is_rerendered(cache_dir, prompts_dir):
+    render_prompt_template('task.jinja', {'name': 'Ada'}, prompts_dir)
+    [sidecar] = cache_dir.glob('task.jinja.*.txt')
+    sidecar.write_bytes(b'\xff\xfe\x00garbage')
+    
+    assert render_prompt_template('task.jinja', {'name': 'Ada'}, prompts_dir) == 'Hi Ada'
+    assert sidecar.read_text(encoding='utf-8') == 'Hi Ada'
+
+
+def test_sidecar_skipped_for_unsortable_config(cache_dir, prompts_dir):
+    config = {'name': {1: 'a', 'x': 1}}
+    
+    assert render_prompt_template('task.jinja', config, prompts_dir) == f"Hi {config['name']}"
+    assert not cache_dir.exists()
+
+
+@pytest.mark.parametrize('template_string', [
+    '  plain text  ',
+    'a\r\nb',
+    'a\rb\n',
+    'hi {{ name }}',
+])
+def test_render_prompt_string_matches_jinja(template_string):
+    expected = Template(template_string).render(CONFIG).strip()
+    
+    assert render_prompt_string(template_string, CONFIG) == expected
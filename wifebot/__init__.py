@@ -2,12 +2,18 @@
 WifeBot - Dating platform automation package.
 """
 
-from .platform import Platform
-from .bumble import BumblePlatform
-from .tinder import TinderPlatform
-from .hinge import HingePlatform
-from .okcupid import OkCupidPlatform
-from .factory import PlatformFactory
+import importlib
+
+# Public name -> submodule; imported lazily so e.g. `wifebot bumble` only loads
+# the Bumble platform module.
+_LAZY_EXPORTS = {
+    'Platform': '.platform',
+    'BumblePlatform': '.bumble',
+    'TinderPlatform': '.tinder',
+    'HingePlatform': '.hinge',
+    'OkCupidPlatform': '.okcupid',
+    'PlatformFactory': '.factory',
+}
 
 __all__ = [
     'Platform',
@@ -18,3 +24,9 @@ __all__ = [
     'PlatformFactory',
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,14 +3,40 @@ Platform factory for creating and managing dating platform agents.
 """
 
 import argparse
+import asyncio
+import functools
+import importlib
+import logging
+import os
 import sys
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Dict, Any, Mapping, Tuple, Type
 
-from .bumble import BumblePlatform
-from .tinder import TinderPlatform
-from .hinge import HingePlatform
-from .okcupid import OkCupidPlatform
-from .loader import load_config
+from .loader import (
+    load_config, get_default_config_value,
+    get_profile_dir, get_trace_path
+)
+
+if TYPE_CHECKING:
+    from .platform import Platform
+
+
+logger = logging.getLogger(__name__)
+
+# Platform name -> (module, class name). Modules are imported on first use so
+# running one platform doesn't load the others. Read-only, so every factory
+# can share it without copying.
+PLATFORMS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    'bumble': ('wifebot.bumble', 'BumblePlatform'),
+    'tinder': ('wifebot.tinder', 'TinderPlatform'),
+    'hinge': ('wifebot.hinge', 'HingePlatform'),
+    'okcupid': ('wifebot.okcupid', 'OkCupidPlatform'),
+})
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize a path so equal locations compare equal."""
+    return os.path.normpath(os.path.expanduser(path))
 
 
 class PlatformFactory:
@@ -22,53 +48,100 @@ class PlatformFactory:
         Args:
             config_path: Optional path to configuration file
         """
-        self.platforms = {
-            'bumble': BumblePlatform,
-            'tinder': TinderPlatform,
-            'hinge': HingePlatform,
-            'okcupid': OkCupidPlatform,
-        }
+        self.platforms = PLATFORMS
         self.config = load_config(config_path)
         self.config_path = config_path
     
     def get_available_platforms(self) -> list:
         """Get list of available platform names."""
-        return list(self.platforms.keys())
+        return list(self.platforms)
     
     def create_platform(self, platform_name: str, **kwargs):
         """Create a platform instance by name with configuration."""
         if platform_name not in self.platforms:
             raise ValueError(f"Unknown platform: {platform_name}. Available: {self.get_available_platforms()}")
         
-        return self.platforms[platform_name](**kwargs)
+        module_name, class_name = self.platforms[platform_name]
+        platform_class: Type['Platform'] = getattr(importlib.import_module(module_name), class_name)
+        return platform_class(**kwargs)
     
     async def run_single_platform(self, platform_name: str, **kwargs):
         """Run a single dating platform agent."""
-        print(f"Starting {platform_name.upper()} dating agent...")
+        logger.info("Starting %s dating agent...", platform_name.upper())
         try:
             platform = self.create_platform(platform_name, **kwargs)
             await platform.run()
-            print(f"{platform_name.upper()} agent completed successfully.")
+            logger.info("%s agent completed successfully.", platform_name.upper())
         except Exception as e:
-            print(f"Error running {platform_name.upper()} agent: {e}")
+            logger.error("Error running %s agent: %s", platform_name.upper(), e)
             raise
     
     async def run_all_platforms(self, **kwargs):
-        """Run agents for all platforms sequentially."""
+        """Run agents for all platforms concurrently.
+        
+        Each platform gets its own browser session. The number of sessions
+        open at once is capped by 'max_concurrent_platforms' in the config
+        file (default: all platforms at once). Platforms run one at a time
+        if any of them would share a profile directory or trace path.
+        """
         platforms = self.get_available_platforms()
-        print(f"Running agents for all platforms: {', '.join(platforms)}")
+        logger.info("Running agents for all platforms: %s", ', '.join(platforms))
         
-        for platform in platforms:
-            print(f"\n{'='*50}")
-            print(f"Starting {platform.upper()} agent...")
-            print('='*50)
-            
-            try:
-                await self.run_single_platform(platform, **kwargs)
-            except Exception as e:
-                print(f"Error running {platform.upper()} agent: {e}")
+        semaphore = asyncio.Semaphore(self._max_concurrent_platforms(platforms, kwargs))
+        
+        async def run_bounded(platform: str):
+            async with semaphore:
+                logger.info("\n%s\nStarting %s agent...\n%s", '='*50, platform.upper(), '='*50)
+                
+                try:
+                    await self.run_single_platform(platform, **kwargs)
+                except Exception as e:
+                    logger.error("Error running %s agent: %s", platform.upper(), e)
+                
+                logger.info("\n%s agent session ended.", platform.upper())
+        
+        tasks = [asyncio.create_task(run_bounded(platform)) for platform in platforms]
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _max_concurrent_platforms(self, platforms: list, kwargs: dict) -> int:
+        """Work out how many platforms run_all_platforms may run at once.
+        
+        Args:
+            platforms: Names of the platforms about to run
+            kwargs: Platform configuration options, as passed to run_all_platforms
             
-            print(f"\n{platform.upper()} agent session ended.")
+        Returns:
+            Number of platforms allowed to run concurrently (at least 1)
+        """
+        # Use the same config file the platforms will load, not the factory's default
+        try:
+            config = load_config(kwargs.get('config_path'))
+        except FileNotFoundError:
+            config = {}
+        
+        max_concurrent = get_default_config_value(config, 'max_concurrent_platforms')
+        if max_concurrent is None:
+            max_concurrent = len(platforms)
+        elif isinstance(max_concurrent, bool) or not isinstance(max_concurrent, int) or max_concurrent < 1:
+            logger.warning(
+                "Ignoring invalid max_concurrent_platforms %r (expected a positive integer)",
+                max_concurrent,
+            )
+            max_concurrent = len(platforms)
+        
+        # A browser profile dir can't be opened twice, and agents sharing a
+        # trace path would overwrite each other's files
+        profile_dirs = set()
+        trace_paths = set()
+        for platform in platforms:
+            profile_dirs.add(_normalize_path(get_profile_dir(config, platform, kwargs.get('profile_dir'))))
+            trace_paths.add(_normalize_path(get_trace_path(config, platform, kwargs.get('trace_path'))))
+        
+        if len(profile_dirs) < len(platforms) or len(trace_paths) < len(platforms):
+            logger.info("Platforms share a profile directory or trace path; running them one at a time.")
+            max_concurrent = 1
+        
+        return max_concurrent
     
     def interactive_mode(self) -> Optional[str]:
         """Interactive mode to choose which platform to run."""
@@ -98,101 +171,11 @@ class PlatformFactory:
                 print("Please enter a valid number.")
     
     def setup_argparse(self) -> argparse.ArgumentParser:
-        """Set up and return the argument parser."""
-        parser = argparse.ArgumentParser(
-            description="Run dating platform agents with configurable options.",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-    wifebot bumble --headless
-    wifebot tinder --model gpt-4 --verbose
-    wifebot hinge --viewport-width 1920 --viewport-height 1080
-    wifebot all --headless --trace-path /tmp/traces
-    wifebot --interactive
-            """
-        )
-        
-        # Positional argument for platform (optional when --interactive is used)
-        choices = self.get_available_platforms() + ['all']
-        parser.add_argument(
-            'platform',
-            nargs='?',
-            choices=choices,
-            help='Dating platform to run or "all" for all platforms'
-        )
-        
-        # Configuration file
-        parser.add_argument(
-            '--config',
-            type=str,
-            help='Path to configuration JSON file (default: config.json)'
-        )
+        """Set up and return the argument parser.
         
-        # Browser configuration flags
-        parser.add_argument(
-            '--headless',
-            action='store_true',
-            help='Run browser in headless mode'
-        )
-        
-        parser.add_argument(
-            '--viewport-width',
-            type=int,
-            help='Browser viewport width'
-        )
-        
-        parser.add_argument(
-            '--viewport-height',
-            type=int,
-            help='Browser viewport height'
-        )
-        
-        parser.add_argument(
-            '--min-wait',
-            type=float,
-            help='Minimum wait time for page loads in seconds'
-        )
-        
-        parser.add_argument(
-            '--max-wait',
-            type=float,
-            help='Maximum wait time for page loads in seconds'
-        )
-        
-        # Profile and trace configuration
-        parser.add_argument(
-            '--profile-dir',
-            type=str,
-            help='Custom browser profile directory'
-        )
-        
-        parser.add_argument(
-            '--trace-path',
-            type=str,
-            help='Custom trace path for logging'
-        )
-        
-        # LLM configuration
-        parser.add_argument(
-            '--model',
-            type=str,
-            help='LLM model to use'
-        )
-        
-        # Utility flags
-        parser.add_argument(
-            '--verbose',
-            action='store_true',
-            help='Enable verbose logging'
-        )
-        
-        parser.add_argument(
-            '--interactive',
-            action='store_true',
-            help='Enter interactive mode to choose platform'
-        )
-        
-        return parser
+        The parser is built once and shared; parse_args() doesn't modify it.
+        """
+        return _build_parser()
     
     def extract_platform_config(self, args) -> Dict[str, Any]:
         """Extract platform configuration from parsed arguments.
@@ -271,3 +254,102 @@ Examples:
         except Exception as e:
             print(f"Fatal error: {e}")
             sys.exit(1)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Run dating platform agents with configurable options.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    wifebot bumble --headless
+    wifebot tinder --model gpt-4 --verbose
+    wifebot hinge --viewport-width 1920 --viewport-height 1080
+    wifebot all --headless --trace-path /tmp/traces
+    wifebot --interactive
+        """
+    )
+    
+    # Positional argument for platform (optional when --interactive is used)
+    choices = list(PLATFORMS) + ['all']
+    parser.add_argument(
+        'platform',
+        nargs='?',
+        choices=choices,
+        help='Dating platform to run or "all" for all platforms'
+    )
+    
+    # Configuration file
+    parser.add_argument(
+        '--config',
+        type=str,
+        help='Path to configuration JSON file (default: config.json)'
+    )
+    
+    # Browser configuration flags
+    parser.add_argument(
+        '--headless',
+        action='store_true',
+        help='Run browser in headless mode'
+    )
+    
+    parser.add_argument(
+        '--viewport-width',
+        type=int,
+        help='Browser viewport width'
+    )
+    
+    parser.add_argument(
+        '--viewport-height',
+        type=int,
+        help='Browser viewport height'
+    )
+    
+    parser.add_argument(
+        '--min-wait',
+        type=float,
+        help='Minimum wait time for page loads in seconds'
+    )
+    
+    parser.add_argument(
+        '--max-wait',
+        type=float,
+        help='Maximum wait time for page loads in seconds'
+    )
+    
+    # Profile and trace configuration
+    parser.add_argument(
+        '--profile-dir',
+        type=str,
+        help='Custom browser profile directory'
+    )
+    
+    parser.add_argument(
+        '--trace-path',
+        type=str,
+        help='Custom trace path for logging'
+    )
+    
+    # LLM configuration
+    parser.add_argument(
+        '--model',
+        type=str,
+        help='LLM model to use'
+    )
+    
+    # Utility flags
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Enable verbose logging'
+    )
+    
+    parser.add_argument(
+        '--interactive',
+        action='store_true',
+        help='Enter interactive mode to choose platform'
+    )
+    
+    return parser
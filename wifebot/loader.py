@@ -2,26 +2,94 @@
 Configuration and prompt loading utilities for wifebot.
 """
 
+import functools
+import hashlib
 import json
 import os
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+import jinja2
 from jinja2 import Template, Environment, FileSystemLoader
+from jinja2.defaults import DEFAULT_NAMESPACE
 
 
+# Marks a missing key in config lookups (None is a valid config value)
+_MISSING = object()
+
+# Matches tags that pull in other templates, whose edits a sidecar key can't see
+_TEMPLATE_REF_RE = re.compile(r'\{%[-+]?\s*(?:include|extends|import|from)\b')
+
+# Matches a bare {{ name }} / {{ dotted.name }} substitution with no filters;
+# numeric subscripts like {{ items.0 }} are left to Jinja2
+_SIMPLE_VAR_RE = re.compile(r'\{\{\s*([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)\s*\}\}')
+
+
+@functools.cache
 def get_project_root() -> Path:
     """Get the project root directory."""
     # This file is in wifebot/, so go up one level to get project root
     return Path(__file__).parent.parent
 
 
+def _read_text(path: str) -> str:
+    """Read a text file, stripped of surrounding whitespace.
+    
+    This is the only place prompt and template text is stripped; everything
+    downstream is served from caches holding the stripped string.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+
+@functools.cache
+def _default_prompts_dir() -> str:
+    """Get project_root/prompts as a plain string path."""
+    return os.path.join(get_project_root(), 'prompts')
+
+
+def _preload_prompts() -> Dict[str, str]:
+    """Read every bundled prompt file in one pass over the prompts directory."""
+    prompts = {}
+    
+    try:
+        with os.scandir(_default_prompts_dir()) as entries:
+            for entry in entries:
+                if entry.name.endswith('.txt') and entry.is_file():
+                    prompts[entry.name[:-len('.txt')]] = _read_text(entry.path)
+    except OSError:
+        # Prompts directory not shipped; load_prompt falls back to reading on demand
+        pass
+    
+    return prompts
+
+
+# Bundled prompts, keyed by prompt name, loaded at import time
+_PROMPT_CACHE = _preload_prompts()
+
+
 def get_xdg_config_home() -> Path:
     """Get XDG_CONFIG_HOME directory, defaulting to ~/.config if not set."""
-    xdg_config_home = os.environ.get('XDG_CONFIG_HOME')
-    if xdg_config_home:
-        return Path(xdg_config_home)
+    return _xdg_dir(os.environ.get('XDG_CONFIG_HOME'), '.config')
+
+
+def get_xdg_cache_home() -> Path:
+    """Get XDG_CACHE_HOME directory, defaulting to ~/.cache if not set."""
+    return _xdg_dir(os.environ.get('XDG_CACHE_HOME'), '.cache')
+
+
+@functools.lru_cache(maxsize=8)
+def _xdg_dir(env_value: Optional[str], home_subdir: str) -> Path:
+    """Build an XDG base directory path; cached per environment value."""
+    if env_value:
+        return Path(env_value)
     else:
-        return Path.home() / '.config'
+        return Path.home() / home_subdir
+
+
+def get_render_cache_dir() -> Path:
+    """Get the directory holding cached rendered prompt templates."""
+    return get_xdg_cache_home() / 'wifebot' / 'prompts'
 
 
 def get_default_config_path() -> Path:
@@ -33,6 +101,10 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from JSON file.
     
+    Parsed configs are cached by (path, mtime), so loading the same unchanged
+    file again returns the previously parsed dictionary. Callers must treat
+    the returned dictionary as read-only.
+    
     Args:
         config_path: Optional path to config file. If None, uses XDG_CONFIG_HOME/wifebot/config.json
         
@@ -45,13 +117,20 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     if config_path is None:
         config_path = get_default_config_path()
-    else:
-        config_path = Path(config_path)
+    config_path = os.fspath(config_path)
     
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
-    with open(config_path, 'r', encoding='utf-8') as f:
+    return _load_config_cached(config_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; memoized by load_config on (path, mtime)."""
+    with open(path_str, 'r', encoding='utf-8') as f:
         config = json.load(f)
     
     return config
@@ -61,6 +140,10 @@ def load_prompt(prompt_name: str, prompts_dir: Optional[str] = None) -> str:
     """
     Load a prompt from a text file.
     
+    Bundled prompts are read once at import time. Other lookups are cached
+    per (prompt_name, prompts_dir), so repeated lookups of the same prompt
+    don't touch the filesystem again.
+    
     Args:
         prompt_name: Name of the prompt file (without .txt extension)
         prompts_dir: Optional directory containing prompts. If None, uses project_root/prompts/
@@ -72,25 +155,31 @@ def load_prompt(prompt_name: str, prompts_dir: Optional[str] = None) -> str:
         FileNotFoundError: If prompt file doesn't exist
     """
     if prompts_dir is None:
-        prompts_dir = get_project_root() / 'prompts'
-    else:
-        prompts_dir = Path(prompts_dir)
-    
-    prompt_file = prompts_dir / f"{prompt_name}.txt"
+        content = _PROMPT_CACHE.get(prompt_name)
+        if content is not None:
+            return content
+        prompts_dir = _default_prompts_dir()
     
-    if not prompt_file.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
-    
-    with open(prompt_file, 'r', encoding='utf-8') as f:
-        content = f.read().strip()
+    return _load_prompt_cached(prompt_name, os.fspath(prompts_dir))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_prompt_cached(prompt_name: str, prompts_dir: str) -> str:
+    """Read a prompt file from disk; memoized by load_prompt."""
+    prompt_file = os.path.join(prompts_dir, prompt_name + '.txt')
     
-    return content
+    try:
+        return _read_text(prompt_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_file}") from None
 
 
 def load_template(template_name: str, prompts_dir: Optional[str] = None) -> str:
     """
     Load a template file for rendering.
     
+    Results are cached per (template_name, prompts_dir).
+    
     Args:
         template_name: Name of the template file (e.g., 'base_task.jinja')
         prompts_dir: Optional directory containing templates. If None, uses project_root/prompts/
@@ -102,25 +191,35 @@ def load_template(template_name: str, prompts_dir: Optional[str] = None) -> str:
         FileNotFoundError: If template file doesn't exist
     """
     if prompts_dir is None:
-        prompts_dir = get_project_root() / 'prompts'
-    else:
-        prompts_dir = Path(prompts_dir)
-    
-    template_file = prompts_dir / template_name
+        prompts_dir = _default_prompts_dir()
     
-    if not template_file.exists():
-        raise FileNotFoundError(f"Template file not found: {template_file}")
-    
-    with open(template_file, 'r', encoding='utf-8') as f:
-        content = f.read().strip()
+    return _load_template_cached(template_name, os.fspath(prompts_dir))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_template_cached(template_name: str, prompts_dir: str) -> str:
+    """Read a template file from disk; memoized by load_template."""
+    template_file = os.path.join(prompts_dir, template_name)
     
-    return content
+    try:
+        return _read_text(template_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template file not found: {template_file}") from None
 
 
 def render_prompt_template(template_name: str, config: Dict[str, Any], prompts_dir: Optional[str] = None) -> str:
     """
     Load and render a prompt template with configuration values.
     
+    Templates that only contain plain {{ variable }} substitutions are
+    rendered directly without Jinja2. For anything else, the rendered output
+    is written to a sidecar file under
+    XDG_CACHE_HOME/wifebot/prompts/, named after a hash of the Jinja2
+    version, the template's mtime and source, and the config. A later call
+    with the same inputs reads that file back instead of going through
+    Jinja2. Only the newest sidecar per template is kept, and templates that
+    include, extend or import other templates are never cached.
+    
     Args:
         template_name: Name of the template file (e.g., 'base_task.jinja')
         config: Configuration dictionary to use for template variables
@@ -133,19 +232,163 @@ def render_prompt_template(template_name: str, config: Dict[str, Any], prompts_d
         FileNotFoundError: If template file doesn't exist
         jinja2.TemplateError: If template rendering fails
     """
-    if prompts_dir is None:
-        prompts_dir = get_project_root() / 'prompts'
-    else:
-        prompts_dir = Path(prompts_dir)
+    prompts_dir = _default_prompts_dir() if prompts_dir is None else os.fspath(prompts_dir)
+    
+    template_src = load_template(template_name, prompts_dir)
+    
+    simple = _render_simple_template(template_src, config)
+    if simple is not None:
+        return simple
+    
+    # Included/extended/imported templates aren't part of the key, so don't cache those
+    if _TEMPLATE_REF_RE.search(template_src):
+        return _get_env(prompts_dir).get_template(template_name).render(config).strip()
     
-    # Set up Jinja2 environment
-    env = Environment(loader=FileSystemLoader(prompts_dir))
+    try:
+        template_mtime_ns = os.stat(os.path.join(prompts_dir, template_name)).st_mtime_ns
+    except OSError:
+        template_mtime_ns = 0
+    
+    # Configs that can't be serialized deterministically (e.g. mixed key types) skip the sidecar
+    try:
+        config_key = json.dumps(config, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return _get_env(prompts_dir).get_template(template_name).render(config).strip()
+    
+    cache_key = '\0'.join((
+        jinja2.__version__,
+        str(template_mtime_ns),
+        template_src,
+        config_key,
+    ))
+    digest = hashlib.blake2b(cache_key.encode('utf-8'), digest_size=16).hexdigest()
+    cache_dir = os.fspath(get_render_cache_dir())
+    cache_file = os.path.join(cache_dir, f"{template_name}.{digest}.txt")
+    
+    # ValueError covers a corrupt or non-UTF-8 cache file; just render again
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, ValueError):
+        pass
     
     # Load and render the template
-    template = env.get_template(template_name)
-    rendered = template.render(config)
+    template = _get_env(prompts_dir).get_template(template_name)
+    rendered = template.render(config).strip()
     
-    return rendered.strip()
+    # Best effort: an unwritable cache dir just means we render next time too
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(rendered)
+        os.replace(tmp_file, cache_file)
+        _prune_render_cache(cache_dir, template_name, cache_file)
+    except OSError:
+        pass
+    
+    return rendered
+
+
+def _prune_render_cache(cache_dir: str, template_name: str, keep_file: str) -> None:
+    """Remove sidecar files for template_name other than keep_file."""
+    prefix = f"{template_name}."
+    
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith('.txt') and entry.path != keep_file:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+
+def _render_simple_template(template_src: str, config: Dict[str, Any]) -> Optional[str]:
+    """
+    Render a template made only of plain {{ variable }} substitutions.
+    
+    Args:
+        template_src: Template source text
+        config: Configuration dictionary to use for template variables
+        
+    Returns:
+        Rendered string, or None if the template needs the full Jinja2 pipeline
+        (statements, comments, filters or expressions)
+    """
+    if '{%' in template_src or '{#' in template_src:
+        return None
+    if '{{' in _SIMPLE_VAR_RE.sub('', template_src):
+        return None
+    
+    try:
+        rendered = _SIMPLE_VAR_RE.sub(
+            lambda match: _lookup_simple_var(config, match.group(1)),
+            template_src,
+        )
+    except _NeedsJinja:
+        return None
+    
+    # template_src is already stripped; only a value at either end can add whitespace
+    if rendered[:1].isspace() or rendered[-1:].isspace():
+        rendered = rendered.strip()
+    
+    return rendered
+
+
+# Top-level names Jinja2 resolves without the config (globals, literals and
+# the template's own `self` reference)
+_JINJA_NAMES = frozenset(DEFAULT_NAMESPACE) | {
+    'self', 'true', 'false', 'none', 'True', 'False', 'None',
+}
+
+
+class _NeedsJinja(Exception):
+    """Raised when a simple variable lookup can't reproduce Jinja2's result."""
+
+
+def _lookup_simple_var(config: Dict[str, Any], key_path: str) -> str:
+    """
+    Resolve a dotted variable the way Jinja2 would, for plain dict configs.
+    
+    Undefined names render as empty strings, as they do in Jinja2. Anything
+    Jinja2 would resolve differently (attribute lookups such as d.keys,
+    non-dict values, attribute access on an undefined name) raises
+    _NeedsJinja so the caller falls back to the real renderer.
+    """
+    keys = _split_key(key_path)
+    value = config
+    
+    for index, key in enumerate(keys):
+        if not isinstance(value, dict):
+            raise _NeedsJinja(key_path)
+        # Jinja2 tries getattr before getitem for dotted access
+        if index > 0 and hasattr(value, key):
+            raise _NeedsJinja(key_path)
+        if key not in value:
+            # Undefined in the config, but Jinja2 has a global or literal by that name
+            if index == 0 and key in _JINJA_NAMES:
+                raise _NeedsJinja(key_path)
+            if index == len(keys) - 1:
+                return ''
+            raise _NeedsJinja(key_path)
+        value = value[key]
+    
+    return str(value)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_env(prompts_dir_str: str) -> Environment:
+    """Get the shared Jinja2 environment for a prompts directory.
+    
+    Compiled templates are kept in the environment's own cache and are not
+    re-checked against the filesystem, since prompts don't change at runtime.
+    """
+    return Environment(
+        loader=FileSystemLoader(prompts_dir_str),
+        auto_reload=False,
+        cache_size=400,
+    )
 
 
 def render_prompt_string(template_string: str, config: Dict[str, Any]) -> str:
@@ -162,6 +405,14 @@ def render_prompt_string(template_string: str, config: Dict[str, Any]) -> str:
     Raises:
         jinja2.TemplateError: If template rendering fails
     """
+    # Plain strings render to themselves; skip compiling a Jinja2 template.
+    # Strings with \r still go through Jinja2, which normalizes newlines to \n.
+    if (
+        '{{' not in template_string and '{%' not in template_string
+        and '{#' not in template_string and '\r' not in template_string
+    ):
+        return template_string.strip()
+    
     template = Template(template_string)
     rendered = template.render(config)
     
@@ -180,15 +431,37 @@ def get_default_config_value(config: Dict[str, Any], key_path: str, default: Any
     Returns:
         Configuration value or default
     """
-    keys = key_path.split('.')
+    return get_config_value_by_keys(config, _split_key(key_path), default)
+
+
+def get_config_value_by_keys(config: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
+    """
+    Get a configuration value using an already split key path.
+    
+    Args:
+        config: Configuration dictionary
+        keys: Key path components (e.g., ('browser', 'headless'))
+        default: Default value to return if key is not found
+        
+    Returns:
+        Configuration value or default
+    """
     value = config
     
-    try:
-        for key in keys:
-            value = value[key]
-        return value
-    except (KeyError, TypeError):
-        return default
+    for key in keys:
+        if not isinstance(value, dict):
+            return default
+        value = value.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+    
+    return value
+
+
+@functools.lru_cache(maxsize=64)
+def _split_key(key_path: str) -> Tuple[str, ...]:
+    """Split a dotted key path into its components."""
+    return tuple(key_path.split('.'))
 
 
 def expand_path_template(template: str, **kwargs) -> str:
@@ -24,10 +24,23 @@ For full list of options: wifebot --help
 """
 
 import asyncio
+import logging
+import sys
 
 from wifebot.factory import PlatformFactory
 
 
+def configure_logging():
+    """Send wifebot log records to stdout as plain messages."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logger = logging.getLogger('wifebot')
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
 async def async_main():
     """Async main entry point."""
     factory = PlatformFactory()
@@ -38,6 +51,7 @@ async def async_main():
 
 def main():
     """Synchronous main entry point for CLI."""
+    configure_logging()
     asyncio.run(async_main())
 
 
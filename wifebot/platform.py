@@ -2,19 +2,43 @@
 Base Platform class and shared constants for dating platform agents.
 """
 
+import logging
 from abc import ABC, abstractmethod
+from functools import cached_property
 from dotenv import load_dotenv
-from browser_use import Agent, BrowserSession, BrowserProfile
-from browser_use.llm import ChatOpenAI
 from .loader import (
-    load_config, get_default_config_value,
+    load_config, get_config_value_by_keys,
     get_profile_dir, get_trace_path, render_prompt_template
 )
 
 
+logger = logging.getLogger(__name__)
+
+_DOTENV_LOADED = False
+
+
+def _ensure_dotenv():
+    """Load .env into the process environment, once per process."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
 class Platform(ABC):
     """Base class for all dating platforms."""
     
+    # (attribute, config file key path, constructor default)
+    _CONFIG_SPEC = (
+        ('headless', ('browser', 'headless'), False),
+        ('viewport_width', ('browser', 'viewport', 'width'), 1280),
+        ('viewport_height', ('browser', 'viewport', 'height'), 1100),
+        ('min_wait', ('browser', 'minimum_wait_page_load_time'), 1),
+        ('max_wait', ('browser', 'maximum_wait_page_load_time'), 10),
+        ('model', ('llm', 'model'), 'gpt-4o-mini'),
+        ('verbose', ('verbose',), False),
+    )
+    
     def __init__(self, config_path=None, **kwargs):
         """Initialize platform with configurable options.
         
@@ -36,7 +60,7 @@ class Platform(ABC):
                 - profile_dir (str, optional): Custom profile directory path
                 - trace_path (str, optional): Custom trace path
         """
-        load_dotenv()
+        _ensure_dotenv()
         
         # Load configuration from file (if it exists)
         try:
@@ -47,53 +71,19 @@ class Platform(ABC):
         # Load and render base task template with configuration
         self.base_task = render_prompt_template('base_task.jinja', self.config)
         
-        # Constructor defaults
-        defaults = {
-            'headless': False,
-            'viewport_width': 1280, 
-            'viewport_height': 1100,
-            'min_wait': 1,
-            'max_wait': 10,
-            'model': 'gpt-4o-mini',
-            'verbose': False
-        }
-        
         # Apply configuration hierarchy: kwargs > config file > constructor defaults
-        self.headless = self._resolve_config_value('headless', kwargs, 'browser.headless', defaults['headless'])
-        self.viewport_width = self._resolve_config_value('viewport_width', kwargs, 'browser.viewport.width', defaults['viewport_width'])
-        self.viewport_height = self._resolve_config_value('viewport_height', kwargs, 'browser.viewport.height', defaults['viewport_height'])
-        self.min_wait = self._resolve_config_value('min_wait', kwargs, 'browser.minimum_wait_page_load_time', defaults['min_wait'])
-        self.max_wait = self._resolve_config_value('max_wait', kwargs, 'browser.maximum_wait_page_load_time', defaults['max_wait'])
-        self.model = self._resolve_config_value('model', kwargs, 'llm.model', defaults['model'])
-        self.verbose = self._resolve_config_value('verbose', kwargs, 'verbose', defaults['verbose'])
+        for attr, config_keys, default_value in self._CONFIG_SPEC:
+            if attr in kwargs:
+                value = kwargs[attr]
+            else:
+                value = get_config_value_by_keys(self.config, config_keys)
+                if value is None:
+                    value = default_value
+            setattr(self, attr, value)
         
         self._custom_profile_dir = kwargs.get('profile_dir')
         self._custom_trace_path = kwargs.get('trace_path')
     
-    def _resolve_config_value(self, param_name: str, kwargs: dict, config_key: str, default_value):
-        """Resolve configuration value using hierarchy: kwargs > config file > constructor defaults.
-        
-        Args:
-            param_name: Parameter name to look up
-            kwargs: Keyword arguments dictionary
-            config_key: Dot-separated key to look up in config file
-            default_value: Constructor default value if not found elsewhere
-            
-        Returns:
-            Final resolved value following priority hierarchy
-        """
-        # 1. Explicit kwarg provided - highest priority
-        if param_name in kwargs:
-            return kwargs[param_name]
-        
-        # 2. Check config file - medium priority
-        config_value = get_default_config_value(self.config, config_key)
-        if config_value is not None:
-            return config_value
-        
-        # 3. Fall back to constructor default - lowest priority
-        return default_value
-        
     @property
     @abstractmethod
     def name(self) -> str:
@@ -112,19 +102,19 @@ class Platform(ABC):
         """Platform-specific instructions"""
         pass
     
-    @property
+    @cached_property
     def profile_dir(self) -> str:
         """Browser profile directory for this platform"""
         return get_profile_dir(self.config, self.name, self._custom_profile_dir)
     
-    @property
+    @cached_property
     def trace_path(self) -> str:
         """Trace path for this platform"""
         return get_trace_path(self.config, self.name, self._custom_trace_path)
     
-    @property
+    @cached_property
     def browser_config(self) -> dict:
-        """Dynamic browser configuration based on constructor parameters and config file"""
+        """Browser configuration based on constructor parameters and config file"""
         return {
             'headless': self.headless,
             'minimum_wait_page_load_time': self.min_wait,
@@ -132,23 +122,27 @@ class Platform(ABC):
             'viewport': {'width': self.viewport_width, 'height': self.viewport_height},
         }
     
-    @property
+    @cached_property
     def llm_config(self) -> dict:
-        """Dynamic LLM configuration based on constructor parameters and config file"""
+        """LLM configuration based on constructor parameters and config file"""
         return {'model': self.model}
     
-    @property
+    @cached_property
     def task(self) -> str:
         """Complete task string with base task + platform-specific instructions"""
         return self.base_task + "\n\n" + self.platform_instructions
     
     async def run(self):
         """Run the dating agent for this platform."""
+        # Imported here: browser_use is slow to import and only needed to run
+        from browser_use import Agent, BrowserSession, BrowserProfile
+        from browser_use.llm import ChatOpenAI
+        
         if self.verbose:
-            print(f"Configuration: {self.browser_config}")
-            print(f"LLM: {self.llm_config}")
-            print(f"Profile dir: {self.profile_dir}")
-            print(f"Trace path: {self.trace_path}")
+            logger.info("Configuration: %s", self.browser_config)
+            logger.info("LLM: %s", self.llm_config)
+            logger.info("Profile dir: %s", self.profile_dir)
+            logger.info("Trace path: %s", self.trace_path)
             
         # Initialize the BrowserSession with dynamic configuration
         browser_session = BrowserSession(